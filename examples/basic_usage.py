@@ -39,8 +39,9 @@ def main():
         opt.zero_grad()
         loss.backward()
 
-        # Passing loss triggers EmotiGrad's emotional feedback
-        opt.step(loss=loss.item())
+        # Passing the loss tensor triggers EmotiGrad's emotional feedback.
+        # EmotiGrad only syncs it to the host when a message is actually due.
+        opt.step(loss=loss)
 
         if step % 5 == 0:
             print(f"[step {step}] loss = {loss.item():.4f}")
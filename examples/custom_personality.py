@@ -51,7 +51,8 @@ def main():
 
         opt.zero_grad()
         loss.backward()
-        opt.step(loss=loss.item())
+        # Pass the tensor directly; .item() is deferred to message steps.
+        opt.step(loss=loss)
 
 
 if __name__ == "__main__":
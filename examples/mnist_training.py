@@ -42,7 +42,7 @@ for epoch in range(1, 3):
 
         opt.zero_grad()
         loss.backward()
-        opt.step(loss=loss.item())  # <-- triggers emotional output!
+        opt.step(loss=loss)  # <-- triggers emotional output (syncs only every 100 steps)!
 
         if step % 200 == 0:
             print(f"[Epoch {epoch}] step={step}, loss={loss.item():.4f}")
@@ -1,8 +1,9 @@
 from .base import EmotionalOptimizer
-from .colors import ColoredPrinter, colorize, create_colored_print_fn
+from .colors import BufferedPrinter, ColoredPrinter, colorize, create_colored_print_fn
 
 __all__ = [
     "EmotionalOptimizer",
+    "BufferedPrinter",
     "ColoredPrinter",
     "colorize",
     "create_colored_print_fn",
@@ -1,16 +1,22 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, Union
 
+import torch
 from torch.optim import Optimizer
 
+from .colors import default_print_fn
+from .personalities import build_personality
 from .types import Personality
 
 PersonalityLike = Union[str, Personality]
 
+# Shared default printer: plain print on a TTY, buffered otherwise.
+_default_printer = default_print_fn()
 
-@dataclass
+
+@dataclass(repr=False, eq=False, slots=True)
 class EmotionalOptimizer:
     """Wrap a PyTorch optimizer and add emotional feedback.
 
@@ -18,63 +24,141 @@ class EmotionalOptimizer:
     - forwards all calls to the underlying optimizer
     - tracks step count and previous loss
     - optionally emits text messages via a personality callable
+
+    The class is slotted: attribute access in the hot step() path hits a
+    fixed slot offset rather than a per-instance __dict__.
+
+    Pass print_fn=None to keep the wrapper API (step counting included)
+    while skipping loss bookkeeping and personality calls entirely. In
+    DDP setups, silence non-main ranks with
+    ``EmotionalOptimizer(opt, enabled=(rank == 0))``.
     """
 
     optimizer: Optimizer
     personality: PersonalityLike = "wholesome"
     enabled: bool = True
-    print_fn: callable = print  # allows tests / users to override output
+    print_fn: callable = _default_printer  # allows tests / users to override output
     message_every: int = 1  # Number of steps between messages
 
-    def __post_init__(self) -> None:
-        self._step: int = 0
-        self._prev_loss: Optional[float] = None
+    # Internal state (excluded from __init__ so it joins the slot layout)
+    _step: int = field(init=False, default=0)
+    _prev_loss: Optional[float] = field(init=False, default=None)
+    _prev_avg_loss: Optional[float] = field(init=False, default=None)
+
+    # Running mean over the current message block (Welford update).
+    # Numerically stable for long blocks, and the average is ready at emit
+    # time without a division.
+    _block_mean: float = field(init=False, default=0.0)
+    _block_n: int = field(init=False, default=0)
 
-        self._step: int = 0
-        self._prev_avg_loss: Optional[float] = None
+    # Countdown to the next message; refilled from message_every on emit.
+    # Cheaper than `_step % message_every` and stays bounded on long runs.
+    _steps_until_msg: int = field(init=False, default=0)
 
-        # For averaging over the last N steps
-        self._block_loss_sum: float = 0.0
-        self._block_loss_count: int = 0
+    # One-shot guard: the personality call is wrapped in try/except only
+    # until the *current* callable succeeds once, then the exception frame
+    # setup is skipped. Tracking the callable (not a flag) re-arms the
+    # guard whenever self.personality is reassigned mid-training.
+    _checked_personality: Optional[callable] = field(init=False, default=None)
+
+    # Bound methods of the wrapped optimizer (see rebind()).
+    _opt_step: callable = field(init=False, default=None)
+    _opt_zero_grad: callable = field(init=False, default=None)
+
+    # True when print_fn=None: output can never happen, so step() skips
+    # all message bookkeeping (useful on non-main DDP ranks).
+    _silent: bool = field(init=False, default=False)
+
+    def __post_init__(self) -> None:
+        self._steps_until_msg = self.message_every
+        self._silent = self.print_fn is None
+        self.rebind()
 
-        # Resolve personality if given as a string
+        # Resolve personality if given as a string; built-ins come back as
+        # closures with their message tables prebound.
         if isinstance(self.personality, str):
-            # Lazy import to avoid circular imports
-            from .personalities import get_personality
+            self.personality = build_personality(self.personality)
 
-            self.personality = get_personality(self.personality)
+    def rebind(self) -> None:
+        """Re-bind the wrapped optimizer's step/zero_grad methods.
 
-    def step(self, loss: Optional[float] = None, *args, **kwargs):
+        The bound methods are cached so the hot path skips the
+        `self.optimizer.step` attribute chain on every call. Call this if
+        you replace `self.optimizer` after construction.
+        """
+        self._opt_step = self.optimizer.step
+        self._opt_zero_grad = self.optimizer.zero_grad
+
+    def step(
+        self,
+        loss: Optional[Union[float, torch.Tensor]] = None,
+        *args,
+        **kwargs,
+    ):
         """Perform an optimization step and optionally emit emotional feedback.
 
         Parameters
         ----------
         loss:
-            Current scalar loss value (e.g., loss.item()).
-            If None, no emotional message is generated for this step.
+            Current scalar loss, either as a Python float (e.g., loss.item())
+            or as a 0-dim tensor. Passing the tensor directly is preferred:
+            the device->host sync implied by .item() is then deferred to the
+            steps that actually emit a message, so non-reporting steps never
+            stall the GPU. If None, no emotional message is generated for
+            this step.
         *args, **kwargs:
             Forwarded to the underlying optimizer's step() method.
         """
-        result = self.optimizer.step(*args, **kwargs)
+        result = self._opt_step(*args, **kwargs)
         self._step += 1
 
-        # Track losses for averaging
-        if loss is not None:
-            self._block_loss_sum += float(loss)
-            self._block_loss_count += 1
-
-        # Decide whether to emit feedback
-        if (
-            self.enabled
-            and loss is not None
-            and self.message_every > 0
-            and (self._step % self.message_every == 0)
-            and self._block_loss_count > 0
-        ):
-            current_avg = self._block_loss_sum / self._block_loss_count
+        # Fast path: the vast majority of steps (no loss, disabled,
+        # silenced, or message_every=0) bail out before any bookkeeping.
+        if loss is None or self._silent or not self.enabled:
+            return result
+
+        if torch.is_tensor(loss):
+            loss = loss.detach()
+
+        current_avg = self._update_state(loss)
+        if current_avg is not None:
+            self._maybe_print(current_avg)
+
+        return result
 
+    def _update_state(self, loss: float) -> Optional[float]:
+        """Fold one loss into the block mean; return it when a message is due.
+
+        This is the side-effect-free half of step(): pure arithmetic with no
+        I/O, exception handling, or dynamic dispatch, so it stays compatible
+        with torch.jit.script / torch.compile graph capture. Users who
+        compile their training step can wrap this; the printing stays in
+        _maybe_print, outside the graph.
+        """
+        # Track the block's running mean (Welford). Tensors are accumulated
+        # on-device so the host sync only happens when a message is due.
+        self._block_n += 1
+        self._block_mean = self._block_mean + (loss - self._block_mean) / self._block_n
+
+        # Countdown gate: a message_every of 0 starts the counter at zero,
+        # so it goes negative and never fires.
+        self._steps_until_msg -= 1
+        if self._steps_until_msg:
+            return None
+        self._steps_until_msg = self.message_every
+
+        # float() is the single device->host sync for this block.
+        avg = float(self._block_mean)
+        self._block_mean = 0.0
+        self._block_n = 0
+        return avg
+
+    def _maybe_print(self, current_avg: float) -> None:
+        """Run the personality on a finished block and emit its message."""
+        if self.personality is self._checked_personality:
+            message = self.personality(current_avg, self._prev_avg_loss, self._step)
+        else:
             try:
-                # message = self.personality(loss, self._prev_loss, self._step)
                 message = self.personality(
                     current_avg,
                     self._prev_avg_loss,
@@ -83,20 +167,27 @@ class EmotionalOptimizer:
             except Exception:
                 # Personality logic should never break training.
                 message = None
+            else:
+                self._checked_personality = self.personality
 
-            if message:
-                self.print_fn(message)
+        if message:
+            self.print_fn(message)
 
-            # Prepare for next block
-            self._prev_avg_loss = current_avg
-            self._block_loss_sum = 0.0
-            self._block_loss_count = 0
-
-        return result
+        self._prev_avg_loss = current_avg
 
     def zero_grad(self, *args, **kwargs):
         """Forward zero_grad to the underlying optimizer."""
-        return self.optimizer.zero_grad(*args, **kwargs)
+        return self._opt_zero_grad(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        # Leaner than the dataclass-generated repr: identity is what
+        # matters for an optimizer wrapper, not field-by-field equality.
+        return (
+            f"{type(self).__name__}("
+            f"optimizer={type(self.optimizer).__name__}, "
+            f"personality={getattr(self.personality, '__name__', self.personality)!r}, "
+            f"step_count={self._step})"
+        )
 
     @property
     def step_count(self) -> int:
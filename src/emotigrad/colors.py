@@ -7,8 +7,16 @@ colorful console output. It includes personality-specific color schemes.
 
 from __future__ import annotations
 
+import atexit
+import io
+import re
+import sys
+from types import MappingProxyType
 from typing import Optional
 
+# Compiled once at import; strip_colors is called per message.
+_ANSI_RE = re.compile(r"\033\[[0-9;]*m")
+
 # ANSI escape codes for colors
 RESET = "\033[0m"
 BOLD = "\033[1m"
@@ -85,25 +93,35 @@ def strip_colors(text: str) -> str:
     str
         Text with all ANSI codes removed.
     """
-    import re
-
-    ansi_escape = re.compile(r"\033\[[0-9;]*m")
-    return ansi_escape.sub("", text)
-
-
-# Personality-specific color schemes
-PERSONALITY_COLORS = {
-    "wholesome": (GREEN, BOLD),
-    "sassy": (MAGENTA, BOLD),
-    "quiet": (DIM,),
-    "nervous": (YELLOW,),
-    "chaotic": (BRIGHT_MAGENTA, BOLD),
-    "arrogant": (CYAN, ITALIC),
-    "tired": (DIM, ITALIC),
-    "hype": (BRIGHT_YELLOW, BOLD),
-    "academic": (BLUE,),
-    "pirate": (BRIGHT_RED, BOLD),
-    "zen": (BRIGHT_CYAN, DIM),
+    # Fast path: uncolored text never enters the regex engine.
+    if "\033" not in text:
+        return text
+    return _ANSI_RE.sub("", text)
+
+
+# Personality-specific color schemes. Read-only: the scheme is fixed at
+# import, and the proxy keeps the underlying hash table stable for lookups.
+PERSONALITY_COLORS = MappingProxyType(
+    {
+        "wholesome": (GREEN, BOLD),
+        "sassy": (MAGENTA, BOLD),
+        "quiet": (DIM,),
+        "nervous": (YELLOW,),
+        "chaotic": (BRIGHT_MAGENTA, BOLD),
+        "arrogant": (CYAN, ITALIC),
+        "tired": (DIM, ITALIC),
+        "hype": (BRIGHT_YELLOW, BOLD),
+        "academic": (BLUE,),
+        "pirate": (BRIGHT_RED, BOLD),
+        "zen": (BRIGHT_CYAN, DIM),
+    }
+)
+
+
+# Joined escape-code prefixes, precomputed so printers don't re-join the
+# color tuples on every message.
+PERSONALITY_PREFIX = {
+    name: "".join(codes) for name, codes in PERSONALITY_COLORS.items()
 }
 
 
@@ -155,9 +173,12 @@ class ColoredPrinter:
     ) -> None:
         self.personality_name = personality_name
         self.enabled = enabled
-        self._colors = (
-            get_personality_colors(personality_name) if personality_name else ()
-        )
+        # Canonicalize the key once and look up the colors inline.
+        key = personality_name.lower() if personality_name else None
+        self._colors = PERSONALITY_COLORS.get(key, ()) if key else ()
+        # Precomputed so each message is one concatenation, not a join.
+        self._prefix = "".join(self._colors)
+        self._suffix = RESET if self._colors else ""
 
     def __call__(self, message: str) -> None:
         """Print the message with personality-specific colors.
@@ -168,7 +189,7 @@ class ColoredPrinter:
             The message to print.
         """
         if self.enabled and self._colors:
-            print(colorize(message, *self._colors))
+            print(f"{self._prefix}{message}{self._suffix}")
         else:
             print(message)
 
@@ -181,7 +202,92 @@ class ColoredPrinter:
             Name of the new personality.
         """
         self.personality_name = personality_name
-        self._colors = get_personality_colors(personality_name)
+        key = personality_name.lower() if personality_name else None
+        self._colors = PERSONALITY_COLORS.get(key, ()) if key else ()
+        self._prefix = "".join(self._colors)
+        self._suffix = RESET if self._colors else ""
+
+
+class BufferedPrinter:
+    """A printer that buffers messages and flushes them in batches.
+
+    Python's built-in ``print`` issues a blocking stdout write (and flush,
+    on line-buffered streams) per message, which becomes a syscall-per-step
+    bottleneck with ``message_every=1``. BufferedPrinter accumulates
+    messages in memory and writes them out after ``flush_every`` messages,
+    once the buffer exceeds ``buffer_size`` bytes, on an explicit
+    :meth:`flush`, or at interpreter exit (via ``atexit``).
+
+    Buffered messages appear *later* than anything the surrounding code
+    prints directly, so redirected logs interleave EmotiGrad's output with
+    your own ``print`` calls only at flush granularity. ``flush_every``
+    bounds how far the two streams drift apart; call :meth:`flush` (or use
+    plain ``print`` as ``print_fn``) wherever exact ordering matters.
+
+    Parameters
+    ----------
+    buffer_size : int, optional
+        Number of buffered characters that triggers an automatic flush.
+        Default is 8192.
+    flush_every : int, optional
+        Number of buffered messages that triggers an automatic flush.
+        Default is 16.
+
+    Examples
+    --------
+    >>> from emotigrad import EmotionalOptimizer
+    >>> from emotigrad.colors import BufferedPrinter
+    >>>
+    >>> printer = BufferedPrinter()
+    >>> emo_opt = EmotionalOptimizer(optimizer, print_fn=printer)
+    """
+
+    def __init__(self, buffer_size: int = 8192, flush_every: int = 16) -> None:
+        self.buffer_size = buffer_size
+        self.flush_every = flush_every
+        self._buffer = io.StringIO()
+        self._pending = 0
+        atexit.register(self.flush)
+
+    def __call__(self, message: str) -> None:
+        """Buffer the message, flushing if either threshold is reached.
+
+        Parameters
+        ----------
+        message : str
+            The message to print.
+        """
+        self._buffer.write(message)
+        self._buffer.write("\n")
+        self._pending += 1
+        if self._pending >= self.flush_every or self._buffer.tell() >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered messages to stdout and empty the buffer."""
+        self._pending = 0
+        data = self._buffer.getvalue()
+        if data:
+            self._buffer = io.StringIO()
+            sys.stdout.write(data)
+            sys.stdout.flush()
+
+
+def default_print_fn() -> callable:
+    """Return the default print function for EmotionalOptimizer.
+
+    Interactive sessions (stdout is a TTY) get plain ``print`` so feedback
+    appears immediately; non-interactive runs (logs, pipes) get a shared
+    :class:`BufferedPrinter` to avoid a stdout syscall per message.
+    """
+    try:
+        interactive = sys.stdout.isatty()
+    except (AttributeError, ValueError):
+        interactive = False
+    return print if interactive else _default_buffered_printer
+
+
+_default_buffered_printer = BufferedPrinter()
 
 
 def create_colored_print_fn(
@@ -1,63 +1,103 @@
 # src/emotigrad/personalities.py
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+import sys
+from functools import lru_cache
+from random import randrange as _randrange
+from types import MappingProxyType
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
 
 from .types import Personality
 
 
+@lru_cache(maxsize=256)
+def _f4(x: float) -> str:
+    """Format a loss to 4 decimal places, caching recent results.
+
+    Personalities format the same (averaged) loss values repeatedly,
+    especially on plateaus; the cache amortizes the float->str conversion.
+    """
+    return format(x, ".4f")
+
+
 # --- Built-in personalities -------------------------------------------------
+
+# Message templates for the simple trend personalities, bound to str.format
+# once at import: at call time CPython dispatches straight into str.format
+# in C, with no per-call f-string assembly. Loss values are pre-formatted
+# through _f4 so the cached float->str conversion is shared. All templates
+# take {0}=loss and {1}=prev_loss (str.format ignores unused arguments),
+# so every table entry shares one call shape.
+_FMT_DEF_START = "✨ Starting our journey! Initial loss: {0}".format
+_FMT_DEF_IMPROVED = "💖 Nice! Loss improved from {1} to {0}.".format
+_FMT_DEF_WORSE = (
+    "🌱 It's okay! Loss went from {1} to {0}. Learning isn't always linear."
+).format
+
+_FMT_WH_START = "✨ Let's get started! Initial loss: {0}".format
+_FMT_WH_IMPROVED = "💖 Nice! Loss improved from {1} to {0}.".format
+_FMT_WH_WORSE = (
+    "🌱 It's okay! Loss went from {1} to {0}. Learning isn't always monotonic."
+).format
+
+_FMT_SASSY_WORSE = "🙄 Bold move: loss got worse ({1} → {0}).".format
+_FMT_SASSY_IMPROVED = "👏 About time: {1} → {0}.".format
+
+# Constant (input-independent) messages, interned so every emission is the
+# same object and downstream comparisons/dict lookups are pointer checks.
+_SASSY_START = sys.intern("😒 Fine, let's see what you've got.")
+_SASSY_EQUAL = sys.intern("🤨 Exactly the same? Interesting choice.")
+
+# Dispatch tables indexed by (loss > prev) - (loss < prev) + 1, i.e.
+# (improved, unchanged, worse). Two compares and a subscript replace the
+# unpredictable if/elif ladder; entries are either a bound .format for the
+# trend messages or a plain string for the constant "unchanged" case.
+_DEF_TABLE = (_FMT_DEF_IMPROVED, "", _FMT_DEF_WORSE)
+_WHOLESOME_TABLE = (_FMT_WH_IMPROVED, "", _FMT_WH_WORSE)
+_SASSY_TABLE = (_FMT_SASSY_IMPROVED, _SASSY_EQUAL, _FMT_SASSY_WORSE)
+
+
 def _default_personality(
     loss: float,
     prev_loss: Optional[float],
     step: int,
-) -> Optional[str]:
+) -> str:
     """Very minimal 'wholesome' personality for early versions.
 
     You can expand this or move it into a dedicated personalities module later.
     """
     if prev_loss is None:
-        return f"✨ Starting our journey! Initial loss: {loss:.4f}"
-
-    if loss < prev_loss:
-        return f"💖 Nice! Loss improved from {prev_loss:.4f} to {loss:.4f}."
+        return _FMT_DEF_START(_f4(loss))
 
-    if loss > prev_loss:
-        return (
-            f"🌱 It's okay! Loss went from {prev_loss:.4f} to {loss:.4f}. "
-            "Learning isn't always linear."
-        )
+    entry = _DEF_TABLE[(loss > prev_loss) - (loss < prev_loss) + 1]
+    if isinstance(entry, str):
+        return entry
+    return entry(_f4(loss), _f4(prev_loss))
 
-    return None
 
-
-def wholesome(loss: float, prev_loss: Optional[float], step: int) -> Optional[str]:
+def wholesome(loss: float, prev_loss: Optional[float], step: int) -> str:
     if prev_loss is None:
-        return f"✨ Let's get started! Initial loss: {loss:.4f}"
-
-    if loss < prev_loss:
-        return f"💖 Nice! Loss improved from {prev_loss:.4f} to {loss:.4f}."
-
-    if loss > prev_loss:
-        return (
-            f"🌱 It's okay! Loss went from {prev_loss:.4f} to {loss:.4f}. "
-            "Learning isn't always monotonic."
-        )
+        return _FMT_WH_START(_f4(loss))
 
-    return None  # no message if unchanged
+    entry = _WHOLESOME_TABLE[(loss > prev_loss) - (loss < prev_loss) + 1]
+    if isinstance(entry, str):
+        return entry  # no message if unchanged
+    return entry(_f4(loss), _f4(prev_loss))
 
 
-def sassy(loss: float, prev_loss: Optional[float], step: int) -> Optional[str]:
+def sassy(loss: float, prev_loss: Optional[float], step: int) -> str:
     if prev_loss is None:
-        return "😒 Fine, let's see what you've got."
+        return _SASSY_START
 
-    if loss > prev_loss:
-        return f"🙄 Bold move: loss got worse ({prev_loss:.4f} → {loss:.4f})."
+    entry = _SASSY_TABLE[(loss > prev_loss) - (loss < prev_loss) + 1]
+    if isinstance(entry, str):
+        return entry
+    return entry(_f4(loss), _f4(prev_loss))
 
-    if loss < prev_loss:
-        return f"👏 About time: {prev_loss:.4f} → {loss:.4f}."
 
-    return "🤨 Exactly the same? Interesting choice."
+_FMT_QUIET = "🔎 Step {}: current loss {}".format
 
 
 class QuietPersonality:
@@ -65,139 +105,151 @@ class QuietPersonality:
 
     def __init__(self, every_n_steps: int = 10) -> None:
         self.every_n_steps = every_n_steps
-
-    def __call__(
-        self, loss: float, prev_loss: Optional[float], step: int
-    ) -> Optional[str]:
-        if step % self.every_n_steps != 0:
-            return None
-        return f"🔎 Step {step}: current loss {loss:.4f}"
-
-
-def nervous(loss: float, prev_loss: Optional[float], step: int) -> Optional[str]:
+        # Next step that emits; a single compare per call instead of a
+        # modulo on the (boxed, ever-growing) step counter.
+        self._next_step = every_n_steps
+
+    def __call__(self, loss: float, prev_loss: Optional[float], step: int) -> str:
+        if step < self._next_step:
+            return ""
+        self._next_step = step + self.every_n_steps
+        return _FMT_QUIET(step, _f4(loss))
+
+
+# The remaining trend personalities share the sign-index dispatch used by
+# wholesome/sassy. Templates take {0}=loss, {1}=prev_loss; str.format
+# ignores unused arguments, so every table entry has the same call shape.
+_FMT_NERVOUS_START = (
+    "😰 Oh no, here we go... Initial loss is {0}. I hope this works..."
+).format
+_NERVOUS_TABLE = (
+    "😅 Phew! Loss dropped from {1} to {0}. But what if it goes back up?!".format,
+    "😬 Loss is exactly the same... {0}. That's... concerning?".format,
+    "😱 I KNEW IT! Loss went up from {1} to {0}! Is everything okay?!".format,
+)
+
+
+def nervous(loss: float, prev_loss: Optional[float], step: int) -> str:
     """A nervous, anxious personality that worries about everything."""
     if prev_loss is None:
-        return (
-            f"😰 Oh no, here we go... Initial loss is {loss:.4f}. I hope this works..."
-        )
+        return _FMT_NERVOUS_START(_f4(loss))
+
+    entry = _NERVOUS_TABLE[(loss > prev_loss) - (loss < prev_loss) + 1]
+    return entry(_f4(loss), _f4(prev_loss))
+
+
+# Chaotic message templates, hoisted so chaotic() doesn't rebuild three
+# lists per call and only formats the single message it actually picks.
+_CHAOS_STARTS = (
+    "🎲 CHAOS BEGINS! Loss: {loss}! LET'S GOOOOO!",
+    "🌪️ *appears from nowhere* Oh, we're training? Loss is {loss}!",
+    "🃏 Wild card activated! Starting loss: {loss}!",
+)
+_CHAOS_GOOD = (
+    "🎉 YEET! {prev_loss} → {loss}! *does a backflip*",
+    "🦄 Loss improved! {prev_loss} → {loss}! Is this magic?!",
+    "🚀 TO THE MOON! Well, to lower loss at least: {loss}!",
+)
+_CHAOS_BAD = (
+    "💥 BOOM! Loss exploded: {prev_loss} → {loss}! EXCITING!",
+    "🎢 Wheeeee! Loss went UP to {loss}! What a ride!",
+    "🔥 This is fine. Loss: {loss}. Everything is fine. 🔥",
+)
+
+
+def chaotic(loss: float, prev_loss: Optional[float], step: int) -> str:
+    """A chaotic, unpredictable personality that says random things."""
+    # Pick the template index first, then format just that one message.
+    if prev_loss is None:
+        return _CHAOS_STARTS[_randrange(3)].format(loss=_f4(loss))
 
     if loss < prev_loss:
-        return (
-            f"😅 Phew! Loss dropped from {prev_loss:.4f} to {loss:.4f}. "
-            "But what if it goes back up?!"
+        return _CHAOS_GOOD[_randrange(3)].format(
+            loss=_f4(loss), prev_loss=_f4(prev_loss)
         )
 
     if loss > prev_loss:
-        return (
-            f"😱 I KNEW IT! Loss went up from {prev_loss:.4f} to {loss:.4f}! "
-            "Is everything okay?!"
+        return _CHAOS_BAD[_randrange(3)].format(
+            loss=_f4(loss), prev_loss=_f4(prev_loss)
         )
 
-    return f"😬 Loss is exactly the same... {loss:.4f}. That's... concerning?"
+    return f"🌀 Time is a flat circle. Loss: {_f4(loss)}. Always has been."
 
 
-def chaotic(loss: float, prev_loss: Optional[float], step: int) -> Optional[str]:
-    """A chaotic, unpredictable personality that says random things."""
-    import random
-
-    if prev_loss is None:
-        chaos_starts = [
-            f"🎲 CHAOS BEGINS! Loss: {loss:.4f}! LET'S GOOOOO!",
-            f"🌪️ *appears from nowhere* Oh, we're training? Loss is {loss:.4f}!",
-            f"🃏 Wild card activated! Starting loss: {loss:.4f}!",
-        ]
-        return random.choice(chaos_starts)
-
-    if loss < prev_loss:
-        good_chaos = [
-            f"🎉 YEET! {prev_loss:.4f} → {loss:.4f}! *does a backflip*",
-            f"🦄 Loss improved! {prev_loss:.4f} → {loss:.4f}! Is this magic?!",
-            f"🚀 TO THE MOON! Well, to lower loss at least: {loss:.4f}!",
-        ]
-        return random.choice(good_chaos)
-
-    if loss > prev_loss:
-        bad_chaos = [
-            f"💥 BOOM! Loss exploded: {prev_loss:.4f} → {loss:.4f}! EXCITING!",
-            f"🎢 Wheeeee! Loss went UP to {loss:.4f}! What a ride!",
-            f"🔥 This is fine. Loss: {loss:.4f}. Everything is fine. 🔥",
-        ]
-        return random.choice(bad_chaos)
+_FMT_ARROGANT_START = (
+    "🧐 *adjusts monocle* Initial loss of {0}? "
+    "I suppose that's... acceptable for a beginner."
+).format
+_ARROGANT_TABLE = (
+    (
+        "😏 Obviously the loss improved ({1} → {0}). You're welcome for my guidance."
+    ).format,
+    "😤 No change at {0}. Clearly, you need my expertise more than ever.".format,
+    (
+        "🙄 Loss increased to {0}? "
+        "Perhaps you should have listened to my earlier suggestions."
+    ).format,
+)
 
-    return f"🌀 Time is a flat circle. Loss: {loss:.4f}. Always has been."
 
-
-def arrogant(loss: float, prev_loss: Optional[float], step: int) -> Optional[str]:
+def arrogant(loss: float, prev_loss: Optional[float], step: int) -> str:
     """An arrogant, condescending personality that thinks it knows better."""
     if prev_loss is None:
-        return (
-            f"🧐 *adjusts monocle* Initial loss of {loss:.4f}? "
-            "I suppose that's... acceptable for a beginner."
-        )
+        return _FMT_ARROGANT_START(_f4(loss))
 
-    if loss < prev_loss:
-        return (
-            f"😏 Obviously the loss improved ({prev_loss:.4f} → {loss:.4f}). "
-            "You're welcome for my guidance."
-        )
+    entry = _ARROGANT_TABLE[(loss > prev_loss) - (loss < prev_loss) + 1]
+    return entry(_f4(loss), _f4(prev_loss))
 
-    if loss > prev_loss:
-        return (
-            f"🙄 Loss increased to {loss:.4f}? "
-            "Perhaps you should have listened to my earlier suggestions."
-        )
 
-    return f"😤 No change at {loss:.4f}. Clearly, you need my expertise more than ever."
+_FMT_TIRED_START = (
+    "😴 *yawn* Oh, we're starting? Loss is {0}... wake me when it's over."
+).format
+_TIRED_TABLE = (
+    "😪 Cool, loss went down... {1} → {0}... can I go back to sleep now?".format,
+    "💤 Loss is still {0}... zzzz...".format,
+    "😩 Ugh, loss went up to {0}. Of course it did. I'm too tired for this.".format,
+)
 
 
-def tired(loss: float, prev_loss: Optional[float], step: int) -> Optional[str]:
+def tired(loss: float, prev_loss: Optional[float], step: int) -> str:
     """A tired, exhausted personality that just wants this to be over."""
     if prev_loss is None:
-        return f"😴 *yawn* Oh, we're starting? Loss is {loss:.4f}... wake me when it's over."
+        return _FMT_TIRED_START(_f4(loss))
 
-    if loss < prev_loss:
-        return (
-            f"😪 Cool, loss went down... {prev_loss:.4f} → {loss:.4f}... "
-            "can I go back to sleep now?"
-        )
+    entry = _TIRED_TABLE[(loss > prev_loss) - (loss < prev_loss) + 1]
+    return entry(_f4(loss), _f4(prev_loss))
 
-    if loss > prev_loss:
-        return (
-            f"😩 Ugh, loss went up to {loss:.4f}. Of course it did. "
-            "I'm too tired for this."
-        )
 
-    return f"💤 Loss is still {loss:.4f}... zzzz..."
+_FMT_HYPE_START = (
+    "🔥🔥🔥 LET'S GOOOOOO!!! Initial loss: {0}! THIS IS GONNA BE AMAZING!!!"
+).format
+_HYPE_TABLE = (
+    (
+        "🎊🎊🎊 YOOOOO!!! LOSS DROPPED FROM {1} TO {0}!!! "
+        "WE'RE LITERALLY UNSTOPPABLE!!! 💪💪💪"
+    ).format,
+    "⚡⚡⚡ LOSS HOLDING STEADY AT {0}!!! THE TENSION IS REAL!!!".format,
+    (
+        "😤😤😤 OKAY SO LOSS WENT UP TO {0} BUT THAT'S JUST "
+        "MAKING THE COMEBACK EVEN MORE EPIC!!! LET'S GO!!!"
+    ).format,
+)
 
 
-def hype(loss: float, prev_loss: Optional[float], step: int) -> Optional[str]:
+def hype(loss: float, prev_loss: Optional[float], step: int) -> str:
     """An extremely hyped, enthusiastic personality."""
     if prev_loss is None:
-        return (
-            f"🔥🔥🔥 LET'S GOOOOOO!!! Initial loss: {loss:.4f}! "
-            "THIS IS GONNA BE AMAZING!!!"
-        )
-
-    if loss < prev_loss:
-        return (
-            f"🎊🎊🎊 YOOOOO!!! LOSS DROPPED FROM {prev_loss:.4f} TO {loss:.4f}!!! "
-            "WE'RE LITERALLY UNSTOPPABLE!!! 💪💪💪"
-        )
-
-    if loss > prev_loss:
-        return (
-            f"😤😤😤 OKAY SO LOSS WENT UP TO {loss:.4f} BUT THAT'S JUST "
-            "MAKING THE COMEBACK EVEN MORE EPIC!!! LET'S GO!!!"
-        )
+        return _FMT_HYPE_START(_f4(loss))
 
-    return f"⚡⚡⚡ LOSS HOLDING STEADY AT {loss:.4f}!!! THE TENSION IS REAL!!!"
+    entry = _HYPE_TABLE[(loss > prev_loss) - (loss < prev_loss) + 1]
+    return entry(_f4(loss), _f4(prev_loss))
 
 
-def academic(loss: float, prev_loss: Optional[float], step: int) -> Optional[str]:
+def academic(loss: float, prev_loss: Optional[float], step: int) -> str:
     """An academic, research-paper style personality."""
     if prev_loss is None:
         return (
-            f"📊 Initial observation: loss function yields {loss:.4f}. "
+            f"📊 Initial observation: loss function yields {_f4(loss)}. "
             "Proceeding with gradient descent optimization."
         )
 
@@ -207,64 +259,118 @@ def academic(loss: float, prev_loss: Optional[float], step: int) -> Optional[str
     if loss < prev_loss:
         return (
             f"📈 Statistically significant improvement observed. "
-            f"Loss decreased from {prev_loss:.4f} to {loss:.4f} "
-            f"(Δ = {delta:.4f}, {pct_change:.2f}% reduction)."
+            f"Loss decreased from {_f4(prev_loss)} to {_f4(loss)} "
+            f"(Δ = {_f4(delta)}, {pct_change:.2f}% reduction)."
         )
 
     if loss > prev_loss:
         return (
-            f"📉 Note: Loss increased from {prev_loss:.4f} to {loss:.4f} "
-            f"(Δ = {delta:.4f}, {abs(pct_change):.2f}% increase). "
+            f"📉 Note: Loss increased from {_f4(prev_loss)} to {_f4(loss)} "
+            f"(Δ = {_f4(delta)}, {abs(pct_change):.2f}% increase). "
             "Further investigation may be warranted."
         )
 
     return (
         f"📋 No statistically significant change detected. "
-        f"Loss remains at {loss:.4f}. Null hypothesis cannot be rejected."
+        f"Loss remains at {_f4(loss)}. Null hypothesis cannot be rejected."
     )
 
 
-def pirate(loss: float, prev_loss: Optional[float], step: int) -> Optional[str]:
+_FMT_PIRATE_START = (
+    "🏴‍☠️ Ahoy! We be settin' sail! Initial loss be {0}, matey!"
+).format
+_PIRATE_TABLE = (
+    (
+        "⚓ Shiver me timbers! Loss dropped from {1} to {0}! That be treasure, arr!"
+    ).format,
+    "🦜 The seas be calm, loss steady at {0}. Onwards, me hearties!".format,
+    (
+        "☠️ Blimey! Loss went up to {0}! We be sailin' into rough waters, ye scallywag!"
+    ).format,
+)
+
+
+def pirate(loss: float, prev_loss: Optional[float], step: int) -> str:
     """A pirate-themed personality. Arrr!"""
     if prev_loss is None:
-        return f"🏴‍☠️ Ahoy! We be settin' sail! Initial loss be {loss:.4f}, matey!"
+        return _FMT_PIRATE_START(_f4(loss))
 
-    if loss < prev_loss:
-        return (
-            f"⚓ Shiver me timbers! Loss dropped from {prev_loss:.4f} to {loss:.4f}! "
-            "That be treasure, arr!"
-        )
+    entry = _PIRATE_TABLE[(loss > prev_loss) - (loss < prev_loss) + 1]
+    return entry(_f4(loss), _f4(prev_loss))
 
-    if loss > prev_loss:
-        return (
-            f"☠️ Blimey! Loss went up to {loss:.4f}! "
-            "We be sailin' into rough waters, ye scallywag!"
-        )
 
-    return f"🦜 The seas be calm, loss steady at {loss:.4f}. Onwards, me hearties!"
+_FMT_ZEN_START = (
+    "🧘 The journey of a thousand gradients begins with a single step. Loss: {0}."
+).format
+_ZEN_TABLE = (
+    "☯️ Like water flowing downhill, the loss descends: {1} → {0}. Breathe.".format,
+    "🌸 Stillness. Loss remains at {0}. Find peace in the plateau.".format,
+    "🍃 The wind sometimes blows against us. Loss: {0}. This too shall pass.".format,
+)
 
 
-def zen(loss: float, prev_loss: Optional[float], step: int) -> Optional[str]:
+def zen(loss: float, prev_loss: Optional[float], step: int) -> str:
     """A zen, peaceful personality focused on the journey."""
     if prev_loss is None:
-        return (
-            f"🧘 The journey of a thousand gradients begins with a single step. "
-            f"Loss: {loss:.4f}."
-        )
+        return _FMT_ZEN_START(_f4(loss))
 
-    if loss < prev_loss:
-        return (
-            f"☯️ Like water flowing downhill, the loss descends: "
-            f"{prev_loss:.4f} → {loss:.4f}. Breathe."
-        )
+    entry = _ZEN_TABLE[(loss > prev_loss) - (loss < prev_loss) + 1]
+    return entry(_f4(loss), _f4(prev_loss))
 
-    if loss > prev_loss:
-        return (
-            f"🍃 The wind sometimes blows against us. Loss: {loss:.4f}. "
-            "This too shall pass."
-        )
 
-    return f"🌸 Stillness. Loss remains at {loss:.4f}. Find peace in the plateau."
+# --- Batch API ---------------------------------------------------------------
+
+
+def _make_batch(start_fmt, table):
+    """Build a vectorized `batch` companion for a table-driven personality.
+
+    The loss-direction classification for a whole array of steps is done in
+    one NumPy pass; only the formatting of each message stays per-item.
+    """
+
+    def batch(
+        losses: Sequence[float],
+        prev_losses: Sequence[float],
+        steps: Sequence[int],
+    ) -> List[str]:
+        """Generate messages for arrays of (loss, prev_loss, step) triples.
+
+        ``prev_losses`` uses NaN for "no previous loss" (the first-step
+        case). Returns one message per input; empty strings mean no
+        message, matching the scalar call convention.
+        """
+        losses = np.asarray(losses, dtype=float)
+        prev = np.asarray(prev_losses, dtype=float)
+        # 0 = first step; 1/2/3 = improved/unchanged/worse (sign + 2).
+        # nan_to_num keeps the cast clean; NaN rows are overridden anyway.
+        sign = np.sign(np.nan_to_num(losses - prev)).astype(int)
+        idx = np.where(np.isnan(prev), 0, sign + 2)
+        messages = []
+        for j, i in enumerate(idx):
+            if i == 0:
+                messages.append(start_fmt(_f4(losses[j])))
+                continue
+            entry = table[i - 1]
+            if isinstance(entry, str):
+                messages.append(entry)
+            else:
+                messages.append(entry(_f4(losses[j]), _f4(prev[j])))
+        return messages
+
+    return batch
+
+
+# Table-driven personalities get a .batch companion; callers can feature-
+# test with hasattr (academic and chaotic stay scalar-only).
+_default_personality.batch = _make_batch(_FMT_DEF_START, _DEF_TABLE)
+wholesome.batch = _make_batch(_FMT_WH_START, _WHOLESOME_TABLE)
+sassy.batch = _make_batch(_SASSY_START.format, _SASSY_TABLE)
+nervous.batch = _make_batch(_FMT_NERVOUS_START, _NERVOUS_TABLE)
+arrogant.batch = _make_batch(_FMT_ARROGANT_START, _ARROGANT_TABLE)
+tired.batch = _make_batch(_FMT_TIRED_START, _TIRED_TABLE)
+hype.batch = _make_batch(_FMT_HYPE_START, _HYPE_TABLE)
+pirate.batch = _make_batch(_FMT_PIRATE_START, _PIRATE_TABLE)
+zen.batch = _make_batch(_FMT_ZEN_START, _ZEN_TABLE)
 
 
 # --- Registry ---------------------------------------------------------------
@@ -273,7 +379,9 @@ def zen(loss: float, prev_loss: Optional[float], step: int) -> Optional[str]:
 _PERSONALITY_REGISTRY: Dict[str, Personality] = {
     "wholesome": wholesome,
     "sassy": sassy,
-    "quiet": QuietPersonality(),  # instance is fine; it's still callable
+    # Stateful: build_personality hands out a fresh copy per optimizer so
+    # this shared entry's emission counter never leaks across runs.
+    "quiet": QuietPersonality(),
     "nervous": nervous,
     "chaotic": chaotic,
     "arrogant": arrogant,
@@ -284,6 +392,25 @@ _PERSONALITY_REGISTRY: Dict[str, Personality] = {
     "zen": zen,
 }
 
+# Registry access is read-heavy: every optimizer construction and
+# get_personality call reads it, while register_personality writes rarely.
+# _REG_GET caches the bound dict.get for the hot lookups; PERSONALITIES is
+# the public read-only view (it tracks registrations live).
+_REG_GET = _PERSONALITY_REGISTRY.get
+PERSONALITIES = MappingProxyType(_PERSONALITY_REGISTRY)
+
+
+# Sorted name cache; registration happens rarely, listing can happen often.
+_CACHED_NAMES: Optional[tuple] = None
+
+
+def _sorted_names() -> tuple:
+    """Return the sorted personality names, rebuilding lazily on change."""
+    global _CACHED_NAMES
+    if _CACHED_NAMES is None:
+        _CACHED_NAMES = tuple(sorted(_PERSONALITY_REGISTRY))
+    return _CACHED_NAMES
+
 
 def register_personality(
     name: str,
@@ -295,22 +422,103 @@ def register_personality(
 
     Users can call this to add their own personalities.
     """
-    key = name.lower()
+    global _CACHED_NAMES
+    # Interned keys let later lookups hash/compare by pointer.
+    key = sys.intern(name.lower())
     if not overwrite and key in _PERSONALITY_REGISTRY:
         raise ValueError(f"Personality '{name}' is already registered.")
     _PERSONALITY_REGISTRY[key] = personality
+    _CACHED_NAMES = None
+
+
+class _UnknownPersonalityError(KeyError):
+    """KeyError for unknown personalities with a lazily built message.
+
+    Sorting and joining the available names only happens if the message
+    is actually rendered; callers that catch-and-ignore pay nothing.
+    """
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.name = name
+
+    def __str__(self) -> str:
+        available = ", ".join(_sorted_names())
+        return f"Unknown personality '{self.name}'. Available: {available}"
 
 
 def get_personality(name: str) -> Personality:
     """Look up a personality by name, raising KeyError if not found."""
-    key = name.lower()
-    try:
-        return _PERSONALITY_REGISTRY[key]
-    except KeyError as exc:
-        available = ", ".join(sorted(_PERSONALITY_REGISTRY.keys()))
-        raise KeyError(f"Unknown personality '{name}'. Available: {available}") from exc
+    # Keys are normalized at registration, so the common canonical-name
+    # lookup skips the .lower() allocation entirely; _REG_GET is the
+    # prebound dict.get, saving the method lookup per call.
+    personality = _REG_GET(name)
+    if personality is not None:
+        return personality
+    personality = _REG_GET(name.lower())
+    if personality is not None:
+        return personality
+    raise _UnknownPersonalityError(name)
 
 
 def list_personalities() -> List[str]:
     """Return a sorted list of available personality names."""
-    return sorted(_PERSONALITY_REGISTRY.keys())
+    return list(_sorted_names())
+
+
+# Start template + dispatch table per table-driven built-in, keyed by the
+# function object so registry overwrites naturally opt out of
+# specialization.
+_TABLES_BY_FN = {
+    _default_personality: (_FMT_DEF_START, _DEF_TABLE),
+    wholesome: (_FMT_WH_START, _WHOLESOME_TABLE),
+    sassy: (_SASSY_START, _SASSY_TABLE),
+    nervous: (_FMT_NERVOUS_START, _NERVOUS_TABLE),
+    arrogant: (_FMT_ARROGANT_START, _ARROGANT_TABLE),
+    tired: (_FMT_TIRED_START, _TIRED_TABLE),
+    hype: (_FMT_HYPE_START, _HYPE_TABLE),
+    pirate: (_FMT_PIRATE_START, _PIRATE_TABLE),
+    zen: (_FMT_ZEN_START, _ZEN_TABLE),
+}
+
+
+def build_personality(name: str) -> Personality:
+    """Resolve a name to a personality specialized for per-step dispatch.
+
+    The personality is chosen once per optimizer, then called every
+    message block, so this bakes the resolved built-in's templates into a
+    closure: the hot-path call touches only closure cells, with no
+    registry or table lookup left inside it. Personalities without a
+    dispatch table (academic, chaotic, quiet, user-registered callables)
+    are returned as-is.
+    """
+    resolved = get_personality(name)
+
+    # QuietPersonality tracks its next emitting step, so the shared
+    # registry instance must not be handed to multiple optimizers: each
+    # resolution gets its own counter.
+    if isinstance(resolved, QuietPersonality):
+        return QuietPersonality(resolved.every_n_steps)
+
+    tables = _TABLES_BY_FN.get(resolved)
+    if tables is None:
+        return resolved
+
+    start, table = tables
+    # Normalize a constant start message to the uniform callable shape;
+    # formatting a placeholder-free string just returns it.
+    start_fmt = start.format if isinstance(start, str) else start
+
+    def _specialized(loss: float, prev_loss: Optional[float], step: int) -> str:
+        if prev_loss is None:
+            return start_fmt(_f4(loss))
+        entry = table[(loss > prev_loss) - (loss < prev_loss) + 1]
+        if isinstance(entry, str):
+            return entry
+        return entry(_f4(loss), _f4(prev_loss))
+
+    # Carry the personality's name so EmotionalOptimizer.__repr__ (which
+    # reads __name__) reports e.g. 'sassy' rather than '_specialized'.
+    _specialized.__name__ = name
+    _specialized.__qualname__ = name
+    return _specialized
@@ -3,14 +3,20 @@ from typing import Optional, Protocol, runtime_checkable
 
 @runtime_checkable
 class Personality(Protocol):
-    """Protocol for personality callables."""
+    """Protocol for personality callables.
+
+    Personalities may additionally expose an optional ``batch(losses,
+    prev_losses, steps)`` method that maps arrays of inputs to a list of
+    messages in one pass (the built-ins do); feature-test it with
+    ``hasattr`` rather than relying on this protocol.
+    """
 
     def __call__(
         self,
         loss: float,
         prev_loss: Optional[float],
         step: int,
-    ) -> Optional[str]:
+    ) -> str:
         """Generate an emotional message based on the optimization state.
 
         Parameters
@@ -22,6 +28,7 @@ class Personality(Protocol):
         step:
             Current optimization step count (starting from 1).
         Returns:
-            An optional string message to emit.
+            A message to emit, or an empty string for "no message".
+            (Returning None also works; any falsy result is discarded.)
         """
         ...
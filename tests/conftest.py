@@ -0,0 +1,46 @@
+# tests/conftest.py
+"""Shared fixtures for the test suite.
+
+Most tests only need "some tiny model and an optimizer wrapping its
+parameters". Building torch modules from scratch (parameter init, optimizer
+state) dominates the runtime of these micro-tests, so a single template is
+initialized once per session and fresh copies are stamped out from its
+state dict.
+"""
+
+import copy
+
+import pytest
+import torch
+
+
+@pytest.fixture(scope="session")
+def _linear_template():
+    """State dict of the tiny Linear(2, 1) template, built once per session."""
+    return torch.nn.Linear(2, 1).state_dict()
+
+
+@pytest.fixture
+def make_model_opt(_linear_template):
+    """Factory returning a fresh (model, SGD optimizer) pair per call.
+
+    Each call loads the session template's weights, so tests get
+    independent models without re-running parameter init.
+    """
+
+    def _make(lr: float = 0.1):
+        model = torch.nn.Linear(2, 1)
+        model.load_state_dict(copy.deepcopy(_linear_template))
+        return model, torch.optim.SGD(model.parameters(), lr=lr)
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def trivial_optimizer():
+    """A minimal SGD over one zero parameter, for tests that never step().
+
+    Tests that only inspect EmotionalOptimizer attributes don't need a
+    real model; sharing one optimizer skips the nn.Module init entirely.
+    """
+    return torch.optim.SGD([torch.nn.Parameter(torch.zeros(1))], lr=0.1)
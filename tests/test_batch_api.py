@@ -0,0 +1,67 @@
+# tests/test_batch_api.py
+"""Tests for the vectorized ``batch`` companion on table-driven personalities.
+
+``batch(losses, prev_losses, steps)`` mirrors the scalar call convention:
+NaN in ``prev_losses`` marks a first step (scalar ``prev_loss=None``), and
+an empty string means "no message".
+"""
+
+import numpy as np
+import pytest
+
+from emotigrad.personalities import (
+    arrogant,
+    hype,
+    nervous,
+    pirate,
+    sassy,
+    tired,
+    wholesome,
+    zen,
+)
+
+# One row per branch: first step, improvement, worsening, unchanged.
+_LOSSES = [1.0, 0.5, 1.5, 1.5]
+_PREVS = [np.nan, 1.0, 1.0, 1.5]
+_STEPS = [1, 2, 3, 4]
+
+
+def test_wholesome_batch_covers_all_branches():
+    messages = wholesome.batch(_LOSSES, _PREVS, _STEPS)
+
+    assert len(messages) == 4
+    assert "Let's get started" in messages[0]
+    assert "1.0000" in messages[0]
+    assert "improved from 1.0000 to 0.5000" in messages[1]
+    assert "went from 1.0000 to 1.5000" in messages[2]
+    # Unchanged loss produces no message, like the scalar call.
+    assert messages[3] == ""
+
+
+def test_sassy_batch_covers_all_branches():
+    messages = sassy.batch(_LOSSES, _PREVS, _STEPS)
+
+    assert len(messages) == 4
+    assert "Fine" in messages[0]
+    assert "About time" in messages[1]
+    assert "Bold move" in messages[2]
+    # Sassy has something to say even about a plateau.
+    assert "Exactly the same" in messages[3]
+
+
+@pytest.mark.parametrize(
+    "fn",
+    [wholesome, sassy, nervous, arrogant, tired, hype, pirate, zen],
+    ids=lambda fn: fn.__name__,
+)
+def test_batch_matches_scalar_calls(fn):
+    """Each batch row must equal the corresponding scalar invocation."""
+    batched = fn.batch(_LOSSES, _PREVS, _STEPS)
+
+    for loss, prev, step, message in zip(_LOSSES, _PREVS, _STEPS, batched):
+        scalar = fn(loss, None if np.isnan(prev) else prev, step)
+        assert message == scalar
+
+
+def test_batch_empty_input_returns_empty_list():
+    assert wholesome.batch([], [], []) == []
@@ -1,7 +1,6 @@
 # tests/test_colors.py
 """Tests for the colored output module."""
 
-
 from emotigrad.colors import (
     BLUE,
     BOLD,
@@ -9,6 +8,7 @@ from emotigrad.colors import (
     PERSONALITY_COLORS,
     RED,
     RESET,
+    BufferedPrinter,
     ColoredPrinter,
     colorize,
     create_colored_print_fn,
@@ -131,6 +131,63 @@ class TestColoredPrinter:
         assert printer._colors == PERSONALITY_COLORS["hype"]
 
 
+class TestBufferedPrinter:
+    """Tests for the BufferedPrinter class."""
+
+    def test_messages_are_buffered_until_flush(self, capsys):
+        """Messages below both thresholds stay in the buffer."""
+        printer = BufferedPrinter(buffer_size=8192, flush_every=100)
+        printer("first")
+        printer("second")
+
+        assert capsys.readouterr().out == ""
+
+        # Drain so the atexit-registered flush has nothing left to emit.
+        printer.flush()
+        capsys.readouterr()
+
+    def test_explicit_flush_writes_buffered_messages(self, capsys):
+        """flush() should emit everything buffered so far, in order."""
+        printer = BufferedPrinter(buffer_size=8192, flush_every=100)
+        printer("first")
+        printer("second")
+        printer.flush()
+
+        assert capsys.readouterr().out == "first\nsecond\n"
+
+    def test_flush_on_byte_threshold(self, capsys):
+        """Crossing buffer_size should trigger an automatic flush."""
+        printer = BufferedPrinter(buffer_size=10, flush_every=100)
+        printer("0123456789ab")
+
+        assert capsys.readouterr().out == "0123456789ab\n"
+
+    def test_flush_on_message_count(self, capsys):
+        """Every flush_every-th message should trigger an automatic flush."""
+        printer = BufferedPrinter(buffer_size=8192, flush_every=3)
+        printer("one")
+        printer("two")
+        assert capsys.readouterr().out == ""
+
+        printer("three")
+        assert capsys.readouterr().out == "one\ntwo\nthree\n"
+
+        # The counter resets: the next flush needs another three messages.
+        printer("four")
+        assert capsys.readouterr().out == ""
+
+        # Drain so the atexit-registered flush has nothing left to emit.
+        printer.flush()
+        capsys.readouterr()
+
+    def test_flush_with_empty_buffer_is_noop(self, capsys):
+        """flush() on an empty buffer should write nothing."""
+        printer = BufferedPrinter()
+        printer.flush()
+
+        assert capsys.readouterr().out == ""
+
+
 class TestCreateColoredPrintFn:
     """Tests for create_colored_print_fn function."""
 
@@ -159,14 +216,13 @@ class TestCreateColoredPrintFn:
 class TestIntegrationWithEmotionalOptimizer:
     """Integration tests with EmotionalOptimizer."""
 
-    def test_colored_printer_as_print_fn(self):
+    def test_colored_printer_as_print_fn(self, make_model_opt):
         """ColoredPrinter should work as EmotionalOptimizer's print_fn."""
         import torch
 
         from emotigrad import EmotionalOptimizer
 
-        model = torch.nn.Linear(2, 1)
-        optimizer = torch.optim.SGD(model.parameters(), lr=0.1)
+        model, optimizer = make_model_opt()
 
         messages = []
 
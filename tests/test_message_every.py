@@ -3,9 +3,8 @@ import torch
 from emotigrad import EmotionalOptimizer
 
 
-def test_message_every_uses_block_average_loss():
-    model = torch.nn.Linear(1, 1)
-    base_opt = torch.optim.SGD(model.parameters(), lr=0.1)
+def test_message_every_uses_block_average_loss(make_model_opt):
+    model, base_opt = make_model_opt()
 
     messages = []
 
@@ -43,3 +42,44 @@ def test_message_every_uses_block_average_loss():
     # Second message
     assert "loss=6.00" in messages[1]
     assert "prev=2.0" in messages[1]
+
+
+def test_step_accepts_tensor_losses(make_model_opt):
+    """0-dim tensor losses must average like floats (the examples pass tensors).
+
+    Covers the detach of grad-carrying tensors, the on-device block
+    accumulation, and the single float() sync at emit time.
+    """
+    model, base_opt = make_model_opt()
+
+    captured = []
+
+    def capture(loss, prev_loss, step):
+        captured.append((loss, prev_loss))
+        return "msg"
+
+    opt = EmotionalOptimizer(
+        base_opt,
+        personality=capture,
+        print_fn=lambda _m: None,
+        message_every=2,
+    )
+
+    # Block 1 = [1.0, 3.0] → average 2.0; the second loss still carries an
+    # autograd graph, as a real training-loop loss would.
+    opt.step(loss=torch.tensor(1.0))
+    graph_loss = torch.tensor(1.5, requires_grad=True) * 2.0
+    assert graph_loss.requires_grad
+    opt.step(loss=graph_loss)
+
+    # Block 2 = [4.0, 6.0] → average 5.0, with the previous block's average
+    # handed through as prev_loss.
+    opt.step(loss=torch.tensor(4.0))
+    opt.step(loss=torch.tensor(6.0))
+
+    assert len(captured) == 2
+    assert isinstance(captured[0][0], float)
+    assert abs(captured[0][0] - 2.0) < 1e-6
+    assert captured[0][1] is None
+    assert abs(captured[1][0] - 5.0) < 1e-6
+    assert abs(captured[1][1] - 2.0) < 1e-6
@@ -1,11 +1,11 @@
+import pytest
 import torch
 
 from emotigrad import EmotionalOptimizer
 
 
-def test_smoke_emotional_optimizer_wraps_optimizer():
-    model = torch.nn.Linear(2, 1)
-    base_opt = torch.optim.SGD(model.parameters(), lr=0.1)
+def test_smoke_emotional_optimizer_wraps_optimizer(make_model_opt):
+    model, base_opt = make_model_opt()
     emo_opt = EmotionalOptimizer(base_opt)
 
     # Just make sure it doesn't crash
@@ -18,9 +18,8 @@ def test_smoke_emotional_optimizer_wraps_optimizer():
 
 
 # Verify that personalities are called correctly and messages are routed through the configured print_fn.
-def test_smoke_emotional_optimizer_personality():
-    model = torch.nn.Linear(2, 1)
-    base_opt = torch.optim.SGD(model.parameters(), lr=0.1)
+def test_smoke_emotional_optimizer_personality(make_model_opt):
+    model, base_opt = make_model_opt()
 
     messages = []
 
@@ -52,10 +51,16 @@ def test_smoke_emotional_optimizer_personality():
     assert len(messages) == 2
 
 
-# Confirm personality is called when loss is provided and enabled=True
-def test_smoke_emotional_optimizer_personality_called():
-    model = torch.nn.Linear(2, 1)
-    base_opt = torch.optim.SGD(model.parameters(), lr=0.1)
+# Confirm the personality is called iff loss is provided and enabled=True
+@pytest.mark.parametrize(
+    ("enabled", "expected_calls"),
+    [(True, 1), (False, 0)],
+    ids=["enabled", "disabled"],
+)
+def test_smoke_emotional_optimizer_personality_called(
+    make_model_opt, enabled, expected_calls
+):
+    model, base_opt = make_model_opt()
 
     called = []
 
@@ -66,45 +71,11 @@ def test_smoke_emotional_optimizer_personality_called():
     emo_opt = EmotionalOptimizer(
         base_opt,
         personality=fake_personality,
-        enabled=True,
-    )
-
-    x = torch.randn(2, 2)
-    y = torch.randn(2, 1)
-    preds = model(x)
-    loss = (preds - y).pow(2).mean()
-
-    emo_opt.zero_grad()
-    loss.backward()
-    emo_opt.step(loss=loss.item())
-
-    assert len(called) == 1
-
-
-# Confirm personality is NOT called when enabled=False
-def test_smoke_emotional_optimizer_personality_not_called_when_disabled():
-    model = torch.nn.Linear(2, 1)
-    base_opt = torch.optim.SGD(model.parameters(), lr=0.1)
-
-    called = []
-
-    def fake_personality(loss, prev_loss, step):
-        called.append((loss, prev_loss, step))
-        return None
-
-    emo_opt = EmotionalOptimizer(
-        base_opt,
-        personality=fake_personality,
-        enabled=False,
+        enabled=enabled,
     )
 
-    x = torch.randn(2, 2)
-    y = torch.randn(2, 1)
-    preds = model(x)
-    loss = (preds - y).pow(2).mean()
-
-    emo_opt.zero_grad()
-    loss.backward()
-    emo_opt.step(loss=loss.item())
+    # Only the call count matters here, so a plain float loss suffices; the
+    # real forward/backward path is covered by the wraps_optimizer smoke test.
+    emo_opt.step(loss=0.5)
 
-    assert len(called) == 0
+    assert len(called) == expected_calls